@@ -57,7 +57,7 @@ def delete_club(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(require_site_admin),
 ):
-    club = db.query(models.Club).filter(models.Club.id == club_id).first()
+    club = db.get(models.Club, club_id)
     if not club:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Club not found")
 
@@ -71,7 +71,7 @@ def delete_user(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(require_site_admin),
 ):
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+    user = db.get(models.User, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -109,7 +109,7 @@ def approve_user(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(require_site_admin),
 ):
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+    user = db.get(models.User, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -119,5 +119,4 @@ def approve_user(
     user.is_active = True
     db.add(user)
     db.commit()
-    db.refresh(user)
     return user
@@ -69,7 +69,6 @@ def register(user_in: schemas.UserCreate, db: Session = Depends(get_db)):
     )
     db.add(user)
     db.commit()
-    db.refresh(user)
     return user
 
 
@@ -144,7 +143,6 @@ def login_for_access_token(
         user.is_active = True
         db.add(user)
         db.commit()
-        db.refresh(user)
 
     token = create_access_token({"sub": str(user.id)})
     return TokenResponse(access_token=token)
@@ -205,7 +203,7 @@ def reset_password(payload: ResetPasswordRequest, db: Session = Depends(get_db))
     ):
         raise HTTPException(status_code=400, detail="Invalid or expired reset link")
 
-    user = db.query(models.User).filter(models.User.id == token_row.user_id).first()
+    user = db.get(models.User, token_row.user_id)
     if not user:
         raise HTTPException(status_code=400, detail="User not found for token")
 
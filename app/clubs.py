@@ -5,14 +5,18 @@ from sqlalchemy.orm import Session
 
 from . import models, schemas
 from .deps import get_db, get_current_user, is_club_owner
-from .tables_api import TABLES, TABLE_CONNECTIONS, close_table_and_report
+from .tables_api import (
+    close_table_and_report,
+    close_table_connections,
+    invalidate_membership_cache,
+)
 from .club_cleanup import delete_club_with_relations
 
 router = APIRouter(prefix="/clubs", tags=["clubs"])
 
 
 def get_owner_email(db: Session, owner_id: int) -> str | None:
-    owner = db.query(models.User).filter(models.User.id == owner_id).first()
+    owner = db.get(models.User, owner_id)
     return owner.email if owner else None
 
 
@@ -45,7 +49,6 @@ def create_club(
     )
     db.add(club)
     db.commit()
-    db.refresh(club)
 
     # owner is also a member
     member = models.ClubMember(club_id=club.id, user_id=current_user.id, role="owner")
@@ -62,7 +65,7 @@ def update_club_crest(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    club = db.query(models.Club).filter(models.Club.id == club_id).first()
+    club = db.get(models.Club, club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
@@ -72,7 +75,6 @@ def update_club_crest(
     club.crest_url = payload.crest_url or "/static/crests/crest-crown.svg"
     db.add(club)
     db.commit()
-    db.refresh(club)
     return build_club_read(club, db)
 
 
@@ -99,7 +101,7 @@ def join_club(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    club = db.query(models.Club).filter(models.Club.id == club_id).first()
+    club = db.get(models.Club, club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
@@ -131,7 +133,7 @@ def leave_club(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    club = db.query(models.Club).filter(models.Club.id == club_id).first()
+    club = db.get(models.Club, club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
@@ -157,6 +159,7 @@ def leave_club(
         db.add(current_user)
 
     db.commit()
+    invalidate_membership_cache(current_user.id, club_id)
 
 
 @router.delete("/{club_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -165,7 +168,7 @@ def delete_club(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    club = db.query(models.Club).filter(models.Club.id == club_id).first()
+    club = db.get(models.Club, club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
@@ -181,7 +184,7 @@ def get_club_detail(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    club = db.query(models.Club).filter(models.Club.id == club_id).first()
+    club = db.get(models.Club, club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
@@ -270,7 +273,7 @@ def list_pending_members(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    club = db.query(models.Club).filter(models.Club.id == club_id).first()
+    club = db.get(models.Club, club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
@@ -313,7 +316,7 @@ def approve_pending_member(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    club = db.query(models.Club).filter(models.Club.id == club_id).first()
+    club = db.get(models.Club, club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
@@ -335,9 +338,8 @@ def approve_pending_member(
     membership.status = "approved"
     db.add(membership)
     db.commit()
-    db.refresh(membership)
 
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+    user = db.get(models.User, user_id)
     balance = user.balance if user else 0
     email = user.email if user else ""
 
@@ -360,7 +362,7 @@ def deny_pending_member(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    club = db.query(models.Club).filter(models.Club.id == club_id).first()
+    club = db.get(models.Club, club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
@@ -389,7 +391,7 @@ def get_club_game_history(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    club = db.query(models.Club).filter(models.Club.id == club_id).first()
+    club = db.get(models.Club, club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
@@ -450,7 +452,7 @@ def adjust_member_balance(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    club = db.query(models.Club).filter(models.Club.id == club_id).first()
+    club = db.get(models.Club, club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
@@ -465,7 +467,7 @@ def adjust_member_balance(
     if not membership:
         raise HTTPException(status_code=404, detail="User is not a member of this club")
 
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+    user = db.get(models.User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -476,7 +478,6 @@ def adjust_member_balance(
     user.balance = new_balance
     db.add(user)
     db.commit()
-    db.refresh(user)
 
     return schemas.BalanceUpdateResponse(user_id=user.id, new_balance=user.balance)
 
@@ -491,7 +492,7 @@ def remove_member(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    club = db.query(models.Club).filter(models.Club.id == club_id).first()
+    club = db.get(models.Club, club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
@@ -511,12 +512,13 @@ def remove_member(
 
     db.delete(membership)
 
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+    user = db.get(models.User, user_id)
     if user and user.current_club_id == club_id:
         user.current_club_id = None
         db.add(user)
 
     db.commit()
+    invalidate_membership_cache(user_id, club_id)
 
 
 @router.post(
@@ -530,7 +532,7 @@ def update_member_role(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    club = db.query(models.Club).filter(models.Club.id == club_id).first()
+    club = db.get(models.Club, club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
@@ -559,9 +561,8 @@ def update_member_role(
     membership.role = payload.role
     db.add(membership)
     db.commit()
-    db.refresh(membership)
 
-    user = db.query(models.User).filter(models.User.id == membership.user_id).first()
+    user = db.get(models.User, membership.user_id)
     balance = user.balance if user else 0
     email = user.email if user else ""
 
@@ -588,7 +589,7 @@ def open_table(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    club = db.query(models.Club).filter(models.Club.id == club_id).first()
+    club = db.get(models.Club, club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
@@ -616,7 +617,6 @@ def open_table(
 
     db.add(table)
     db.commit()
-    db.refresh(table)
 
     return table
 
@@ -631,7 +631,7 @@ def close_table(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    club = db.query(models.Club).filter(models.Club.id == club_id).first()
+    club = db.get(models.Club, club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
@@ -652,4 +652,4 @@ def close_table(
         raise HTTPException(status_code=404, detail="Active table not found")
 
     close_table_and_report(table, db)
-    TABLE_CONNECTIONS.pop(table_id, None)
+    close_table_connections(table_id)
@@ -12,11 +12,30 @@ SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    # Hold a pool of connections instead of the SQLite default of one per
+    # checkout; threadpool request handlers and background sweeps check
+    # sessions in and out constantly, so reconnect churn adds up. The sizes
+    # are overridable from the environment for deployments with different
+    # concurrency profiles.
+    pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "30")),
+    pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+    pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    pool_pre_ping=True,
+    # LIFO keeps the hot connections (and their page caches) in rotation
+    # and lets the rest age out via pool_recycle.
+    pool_use_lifo=True,
 )
 
 Base = declarative_base()
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: request-scoped sessions don't need their objects
+# invalidated after commit, and the implicit reload SELECTs that expiry
+# causes were a per-request tax. Code that updates rows with server-side
+# expressions refreshes explicitly where it still reads the object.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 def ensure_schema():
@@ -38,7 +38,7 @@ def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    user = db.query(models.User).filter(models.User.id == int(user_id)).first()
+    user = db.get(models.User, int(user_id))
     if user is None:
         raise credentials_exception
 
@@ -1,8 +1,11 @@
+import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.security import OAuth2PasswordBearer
 from fastapi.staticfiles import StaticFiles
 
@@ -10,7 +13,11 @@ from app.database import Base, engine, ensure_schema_once
 from app import models
 from app.auth import router as auth_router
 from app.clubs import router as clubs_router
-from app.tables_api import router as tables_router
+from app.tables_api import (
+    router as tables_router,
+    start_broadcast_worker,
+    stop_broadcast_worker,
+)
 from app.admin import router as admin_router
 from app.ws_api import ws_router
 from app import routes_user
@@ -18,7 +25,16 @@ from app import routes_user
 Base.metadata.create_all(bind=engine)
 ensure_schema_once()
 
-app = FastAPI(title="Poker Platform MVP")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The broadcast worker fans table state out to websockets off the
+    # request path; it needs the running event loop, hence lifespan.
+    start_broadcast_worker()
+    yield
+    stop_broadcast_worker()
+
+
+app = FastAPI(title="Poker Platform MVP", lifespan=lifespan)
 static_dir = Path(__file__).resolve().parent / "static"
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
@@ -54,6 +70,29 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
+_openapi_bytes: bytes | None = None
+
+
+@app.get("/openapi.json", include_in_schema=False)
+def serve_openapi() -> Response:
+    """Serve the OpenAPI schema serialized once per process."""
+
+    global _openapi_bytes
+    if _openapi_bytes is None:
+        _openapi_bytes = orjson.dumps(custom_openapi())
+    return Response(_openapi_bytes, media_type="application/json")
+
+
+# FastAPI registered its own /openapi.json route at construction time, which
+# wins by order and re-serializes the schema dict on every hit; drop it so
+# the cached-bytes route above serves instead.
+app.router.routes[:] = [
+    r
+    for r in app.router.routes
+    if getattr(r, "path", None) != "/openapi.json"
+    or getattr(r, "endpoint", None) is serve_openapi
+]
+
 # ---- Include all routers ----
 app.include_router(auth_router)          # /auth/...
 app.include_router(clubs_router)         # /clubs/...
@@ -66,6 +105,13 @@ app.include_router(ws_router)            # /ws/...
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 
+# Page HTML cached per process — these files are small and only change on
+# deploy, so re-reading them per request is wasted syscalls. Set DEBUG=1 to
+# re-read from disk on every request while editing templates.
+_HTML_CACHE: dict[str, str] = {}
+_HTML_CACHE_DISABLED = os.getenv("DEBUG", "").lower() in {"1", "true", "yes"}
+
+
 def _serve_html(filename: str) -> HTMLResponse:
     """Serve an HTML file from the static directory.
 
@@ -74,8 +120,11 @@ def _serve_html(filename: str) -> HTMLResponse:
     responses when hitting the root domain.
     """
 
-    file_path = static_dir / filename
-    return HTMLResponse(file_path.read_text(encoding="utf-8"))
+    content = None if _HTML_CACHE_DISABLED else _HTML_CACHE.get(filename)
+    if content is None:
+        content = (static_dir / filename).read_text(encoding="utf-8")
+        _HTML_CACHE[filename] = content
+    return HTMLResponse(content)
 
 
 @app.get("/")
@@ -183,3 +232,11 @@ def read_reset_password_page():
 @app.get("/table-history.html")
 def read_table_history_page():
     return _serve_html("table-history.html")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop batches socket writes far better than the default selector loop,
+    # which matters for the websocket broadcast fan-out under load.
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, loop="uvloop")
@@ -46,7 +46,7 @@ class Rank(IntEnum):
         return mapping[self]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Card:
     rank: Rank
     suit: Suit
@@ -57,3 +57,11 @@ class Card:
 
     def __repr__(self) -> str:
         return str(self)
+
+
+# Display strings for the fixed 52-card universe, computed once at import.
+# Cards are immutable and hashable, so serialization hot paths can use a
+# dict lookup instead of dispatching Card.__str__ per card.
+CARD_STRINGS = {
+    Card(rank, suit): f"{rank.short()}{suit.short()}" for suit in Suit for rank in Rank
+}
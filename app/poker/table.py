@@ -3,15 +3,18 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set
 
 from .deck import Deck
-from .cards import Card
+from .cards import Card, CARD_STRINGS
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     id: int
     name: str
     seat: int
     hole_cards: List[Card] = field(default_factory=list)
+    # Display form of hole_cards, refreshed when cards are dealt so state
+    # serialization reuses it instead of re-stringifying every broadcast.
+    hole_strs: List[str] = field(default_factory=list)
     in_hand: bool = True        # still in the current hand
     sitting_out: bool = False   # player has opted out of upcoming hands
     has_folded: bool = False
@@ -30,6 +33,21 @@ class Player:
         )
 
 
+@dataclass(slots=True)
+class TableSnapshot:
+    """Single-pass summary of the player list for API hot paths.
+
+    Collects everything the broadcast pipeline needs (hand contenders, the
+    all-in flag, seated-and-ready count, seated user ids) in one walk instead
+    of one filtering pass per consumer.
+    """
+
+    contenders: List[Player]
+    all_all_in: bool
+    ready_count: int
+    user_ids: Set[int]
+
+
 class Table:
     """
     Simple 2+ player Texas Hold'em table model:
@@ -53,6 +71,9 @@ class Table:
         self.players: List[Player] = []
         self.deck: Deck = Deck()
         self.board: List[Card] = []
+        # Display form of the board, maintained on street transitions (cards
+        # only change then, so serialization never re-stringifies them).
+        self.board_strs: List[str] = []
         self.hand_number: int = 0
 
         # Betting-related
@@ -80,6 +101,16 @@ class Table:
         # Internal id counter to ensure player ids remain unique even after seats are vacated
         self._next_player_id: int = 1
 
+        # Monotonic state version, bumped by every mutating operation. The
+        # API layer compares it against the last broadcast version so
+        # keepalive-triggered broadcasts of unchanged state can be skipped.
+        self.version: int = 0
+
+        # Seated players indexed by user id so API-layer lookups are O(1)
+        # instead of scanning the player list. Maintained by add_player /
+        # remove_player_by_user; bot seats (user_id=None) are not indexed.
+        self._players_by_user: Dict[int, Player] = {}
+
         # Simple in-memory history of recent hands (action-only, non-persisted)
         self.recent_hands: List[Dict[str, Any]] = []
         self.current_hand_log: Optional[Dict[str, Any]] = None
@@ -137,8 +168,15 @@ class Table:
         )
         self._next_player_id += 1
         self.players.append(new_player)
+        if user_id is not None:
+            self._players_by_user[user_id] = new_player
+        self.version += 1
         return new_player
 
+    def player_for_user(self, user_id: int) -> Optional[Player]:
+        """Return the seated player for a user id, or None."""
+        return self._players_by_user.get(user_id)
+
     def get_player_by_id(self, player_id: int) -> Player:
         for p in self.players:
             if p.id == player_id:
@@ -149,12 +187,7 @@ class Table:
         if seat < 0 or seat >= self.max_seats:
             raise ValueError("Invalid seat number")
 
-        player = None
-        for p in self.players:
-            if p.user_id == user_id:
-                player = p
-                break
-
+        player = self._players_by_user.get(user_id)
         if player is None:
             raise ValueError("Player not seated")
 
@@ -163,6 +196,7 @@ class Table:
                 raise ValueError("Seat already occupied")
 
         player.seat = seat
+        self.version += 1
         return player
 
     def active_players(self) -> List[Player]:
@@ -173,6 +207,29 @@ class Table:
             if p.in_hand and not p.has_folded and p.stack >= 0
         ]
 
+    def snapshot(self) -> TableSnapshot:
+        """Summarize the player list in a single pass."""
+
+        contenders: List[Player] = []
+        all_all_in = True
+        ready_count = 0
+        user_ids: Set[int] = set(self._players_by_user)
+
+        for p in self.players:
+            if not p.sitting_out:
+                ready_count += 1
+            if p.in_hand and not p.has_folded and p.stack >= 0:
+                contenders.append(p)
+                if not p.all_in:
+                    all_all_in = False
+
+        return TableSnapshot(
+            contenders=contenders,
+            all_all_in=all_all_in,
+            ready_count=ready_count,
+            user_ids=user_ids,
+        )
+
     # ---------- Hand + dealing ----------
 
     def start_new_hand(self) -> None:
@@ -184,6 +241,7 @@ class Table:
         self.hand_number += 1
         self.deck.reset()
         self.board = []
+        self.board_strs = []
         self.pot = 0
         self.current_bet = 0
         self.last_raise_amount = self.big_blind
@@ -244,8 +302,12 @@ class Table:
                     continue
                 p.hole_cards.append(self.deck.deal_one())
 
+        for p in self.players:
+            p.hole_strs = [CARD_STRINGS[c] for c in p.hole_cards]
+
         # Post blinds
         self.post_blinds()
+        self.version += 1
 
     def post_blinds(self) -> None:
         """Post small and big blinds and set next_to_act."""
@@ -436,26 +498,27 @@ class Table:
     def remove_player_by_user(self, user_id: int) -> Player:
         """Remove a seated player by their user id and clear related markers."""
 
-        for idx, p in enumerate(self.players):
-            if p.user_id == user_id:
-                removed = self.players.pop(idx)
-
-                if self.dealer_seat == removed.seat:
-                    self.dealer_seat = None
-                if self.dealer_button_seat == removed.seat:
-                    self.dealer_button_seat = None
-                if self.small_blind_seat == removed.seat:
-                    self.small_blind_seat = None
-                if self.big_blind_seat == removed.seat:
-                    self.big_blind_seat = None
-                if self.next_to_act_seat == removed.seat:
-                    self.next_to_act_seat = None
-                if self.next_to_act_seat is None:
-                    self.action_deadline = None
-
-                return removed
+        removed = self._players_by_user.pop(user_id, None)
+        if removed is None:
+            raise ValueError("No player for that user id")
+
+        self.players.remove(removed)
+
+        if self.dealer_seat == removed.seat:
+            self.dealer_seat = None
+        if self.dealer_button_seat == removed.seat:
+            self.dealer_button_seat = None
+        if self.small_blind_seat == removed.seat:
+            self.small_blind_seat = None
+        if self.big_blind_seat == removed.seat:
+            self.big_blind_seat = None
+        if self.next_to_act_seat == removed.seat:
+            self.next_to_act_seat = None
+        if self.next_to_act_seat is None:
+            self.action_deadline = None
 
-        raise ValueError("No player for that user id")
+        self.version += 1
+        return removed
 
     def _set_action_deadline(self) -> None:
         if self.next_to_act_seat is None:
@@ -477,6 +540,7 @@ class Table:
             # If the tracked seat was cleared due to a disconnect, stop the timer
             self.next_to_act_seat = None
             self.action_deadline = None
+            self.version += 1
             return None
         try:
             self.sit_out_player(player, auto=True, reason="timeout")
@@ -484,6 +548,7 @@ class Table:
             # If the auto action fails, give up and clear the deadline to avoid loops
             self.next_to_act_seat = None
             self.action_deadline = None
+            self.version += 1
             return None
 
         return "sit_out"
@@ -516,11 +581,16 @@ class Table:
 
             if self.next_to_act_seat == player.seat:
                 self._advance_turn()
+                self.version += 1
                 return
 
         if self.next_to_act_seat is None:
             self.action_deadline = None
 
+        # Bumped on exit, not entry, so concurrent snapshots of half-applied
+        # state cache under the old version and self-invalidate.
+        self.version += 1
+
     def return_player_to_game(self, player: Player) -> None:
         """Allow a sitting-out player to join the next hand."""
 
@@ -530,6 +600,7 @@ class Table:
             player.in_hand = False
             player.has_folded = False
             player.all_in = False
+        self.version += 1
 
     # ---------- Betting logic ----------
 
@@ -634,6 +705,9 @@ class Table:
         self.acted_this_round.add(acting_player.seat)
         self._log_action(self.street, acting_player, action, event_amount, auto=auto)
         self._advance_turn()
+        # Bump last so a concurrent snapshot of half-applied state caches
+        # under the pre-action version and self-invalidates.
+        self.version += 1
 
     def _advance_turn(self) -> None:
         if all(p.has_folded or p.all_in for p in self.players):
@@ -696,26 +770,35 @@ class Table:
     def deal_flop(self) -> None:
         if self.street != "preflop":
             raise ValueError("Flop can only be dealt after preflop betting")
-        self.board.extend([self.deck.deal_one() for _ in range(3)])
+        flop = [self.deck.deal_one() for _ in range(3)]
+        self.board.extend(flop)
+        self.board_strs.extend(CARD_STRINGS[c] for c in flop)
         self.street = "flop"
         self._log_street_transition("flop")
         self.reset_committed_for_new_street()
+        self.version += 1
 
     def deal_turn(self) -> None:
         if self.street != "flop":
             raise ValueError("Turn can only be dealt after flop")
-        self.board.append(self.deck.deal_one())
+        turn = self.deck.deal_one()
+        self.board.append(turn)
+        self.board_strs.append(CARD_STRINGS[turn])
         self.street = "turn"
         self._log_street_transition("turn")
         self.reset_committed_for_new_street()
+        self.version += 1
 
     def deal_river(self) -> None:
         if self.street != "turn":
             raise ValueError("River can only be dealt after turn")
-        self.board.append(self.deck.deal_one())
+        river = self.deck.deal_one()
+        self.board.append(river)
+        self.board_strs.append(CARD_STRINGS[river])
         self.street = "river"
         self._log_street_transition("river")
         self.reset_committed_for_new_street()
+        self.version += 1
 
     # ---------- Showdown ----------
 
@@ -761,6 +844,7 @@ class Table:
 
         self.street = "showdown"
         self._finalize_hand(winners, payouts, pot_before, reason="showdown")
+        self.version += 1
         return winners, best_rank, results, payouts
 
     def __repr__(self) -> str:
@@ -2,7 +2,7 @@ from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 from pydantic import BaseModel
 
 from app import models, schemas
@@ -10,6 +10,19 @@ from app.deps import get_db, get_current_user, is_club_owner
 
 router = APIRouter(tags=["users"])
 
+# Columns the UserMe response actually serializes; endpoints that only read
+# and return the profile load these instead of hydrating the full row
+# (notably skipping hashed_password).
+_USER_ME_COLUMNS = load_only(
+    models.User.id,
+    models.User.username,
+    models.User.email,
+    models.User.balance,
+    models.User.current_club_id,
+    models.User.profile_picture_url,
+    models.User.university,
+)
+
 UK_UNIVERSITIES = [
     "AECC University College",
     "Abertay University",
@@ -174,7 +187,12 @@ def read_me(
     email: str = Query(..., description="User email"),
     db: Session = Depends(get_db),
 ):
-    user = db.query(models.User).filter(models.User.email == email).first()
+    user = (
+        db.query(models.User)
+        .options(_USER_ME_COLUMNS)
+        .filter(models.User.email == email)
+        .first()
+    )
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
@@ -197,7 +215,6 @@ def update_profile_picture(
     user.profile_picture_url = body.profile_picture_url.strip() or None
     db.add(user)
     db.commit()
-    db.refresh(user)
     return user
 
 # ---------- /wallet/topup ----------
@@ -219,8 +236,12 @@ def wallet_topup(
             status_code=403, detail="Only club owners can adjust wallet balances"
         )
 
-    current_user.balance += body.amount
-    db.add(current_user)
+    # Server-side increment: no read-modify-write race between concurrent
+    # top-ups, and no full-row hydration just to bump one column.
+    db.query(models.User).filter(models.User.id == current_user.id).update(
+        {"balance": models.User.balance + body.amount},
+        synchronize_session=False,
+    )
     db.commit()
     db.refresh(current_user)
     return current_user
@@ -236,31 +257,35 @@ def set_current_club(
     email: str = Query(..., description="User email"),
     db: Session = Depends(get_db),
 ):
-    user = db.query(models.User).filter(models.User.email == email).first()
+    user = (
+        db.query(models.User)
+        .options(_USER_ME_COLUMNS)
+        .filter(models.User.email == email)
+        .first()
+    )
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    club = db.query(models.Club).filter(models.Club.id == body.club_id).first()
+    club = db.get(models.Club, body.club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
-    membership = (
-        db.query(models.ClubMember)
+    membership_id = (
+        db.query(models.ClubMember.id)
         .filter(
             models.ClubMember.club_id == club.id,
             models.ClubMember.user_id == user.id,
             models.ClubMember.status == "approved",
         )
-        .first()
+        .scalar()
     )
     is_owner = is_club_owner(db, club.id, user.id)
-    if not membership and not is_owner:
+    if membership_id is None and not is_owner:
         raise HTTPException(status_code=403, detail="User is not approved for this club")
 
     user.current_club_id = club.id
     db.add(user)
     db.commit()
-    db.refresh(user)
     return user
 
 
@@ -290,7 +315,7 @@ def get_profile(
             club_id = membership.club_id
 
     if club_id:
-        club = db.query(models.Club).filter(models.Club.id == club_id).first()
+        club = db.get(models.Club, club_id)
         club_name = club.name if club else None
 
     hand_rows = (
@@ -437,7 +462,6 @@ def update_university(
     user.university = body.university or None
     db.add(user)
     db.commit()
-    db.refresh(user)
     return user
 
 
@@ -158,10 +158,10 @@ class PlayerState(BaseModel):
     committed: float
     sitting_out: bool = False
     in_hand: bool
-    has_folded: bool
-    all_in: bool
+    has_folded: bool = False
+    all_in: bool = False
     hole_cards: List[str]
-    user_id: Optional[int]
+    user_id: Optional[int] = None
     profile_picture_url: Optional[str] = None
 
 
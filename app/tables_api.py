@@ -1,11 +1,17 @@
+import asyncio
+from collections import defaultdict
 from datetime import datetime, timedelta
+import threading
 import time
-from typing import Dict, Optional, Set
+from typing import Dict, Optional, Set, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, WebSocket
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, WebSocket
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import case, update
 from sqlalchemy.orm import Session
 
-from app.poker.table import Table
+from app.poker.table import Table, TableSnapshot
 from . import models, schemas
 from .deps import get_current_user, get_db, is_club_owner
 from .database import SessionLocal
@@ -13,15 +19,249 @@ from .database import SessionLocal
 router = APIRouter(prefix="/tables", tags=["tables"])
 TABLE_EXPIRY = timedelta(hours=24)
 SIT_OUT_AUTO_LEAVE_SECONDS = 6 * 60
+SIT_OUT_SWEEP_INTERVAL_SECONDS = 10
 
 # In-memory engine tables
 TABLES: Dict[int, Table] = {}
 
+# Serializes engine mutations per table. The hand-play endpoints dispatch
+# engine calls to worker threads so the event loop stays responsive; the lock
+# keeps two requests against the same table from interleaving engine state
+# while different tables still run in parallel.
+_TABLE_LOCKS: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+
 # WebSocket connections per table: table_id -> { websocket: viewer_user_id or None }
-TABLE_CONNECTIONS: Dict[int, Dict[WebSocket, Optional[int]]] = {}
+TABLE_CONNECTIONS: Dict[int, Dict[WebSocket, Optional[int]]] = defaultdict(dict)
 # WebSocket connections keyed by seated user_id so we can notify all players at a table
 USER_CONNECTIONS: Dict[int, Set[WebSocket]] = {}
 
+# Guards composite mutations of the connection registries above; REST handlers
+# run on threadpool workers while the websocket handlers run on the event
+# loop, so single-op dict atomicity is not enough.
+_REGISTRY_LOCK = threading.RLock()
+
+# Outgoing state queue and writer task per websocket. The queue is bounded to
+# one entry: state payloads are full snapshots, so a newer one always
+# supersedes whatever the client has not read yet.
+_WS_QUEUES: Dict[WebSocket, asyncio.Queue] = {}
+_WS_WRITERS: Dict[WebSocket, asyncio.Task] = {}
+
+# Last serialized snapshot handed to each socket. Broadcasts fire on every
+# mutation and keepalive, but most of them change nothing for most viewers
+# (e.g. another player's chat ping), so identical payloads are dropped here
+# instead of re-sent. The frontend replaces its whole view per frame and
+# cannot apply deltas, so suppression-of-identical is the diffing this
+# client supports.
+_WS_LAST_SENT: Dict[WebSocket, str] = {}
+
+# A send that cannot complete within this window means the client's TCP
+# buffer has been full for a while; drop the connection rather than let its
+# writer task sit on a stale snapshot indefinitely.
+WS_SEND_TIMEOUT_SECONDS = 2.0
+
+# One background maintenance task per table with open websockets; it owns the
+# sit-out grace-period sweep so broadcasts don't have to.
+_MAINTENANCE_TASKS: Dict[int, asyncio.Task] = {}
+
+# Timer per table armed for the current actor's deadline. Timeouts used to be
+# enforced lazily by whichever request came next, so an idle table never
+# folded its absent player; the timer fires a broadcast (which enforces the
+# timeout) punctually instead.
+_TIMEOUT_HANDLES: Dict[int, asyncio.TimerHandle] = {}
+
+# Positive membership checks cached briefly, keyed (user_id, club_id) so one
+# entry covers every table in the club and every table action does not re-run
+# the authorization query. Only approvals are cached; revocations are
+# invalidated eagerly from the club membership endpoints, with the short TTL
+# as a backstop. This is process-local state — a multi-worker deployment
+# would need a shared store instead — which matches how the engine tables
+# themselves are held in this process.
+_MEMBERSHIP_CACHE: Dict[Tuple[int, int], float] = {}
+_MEMBERSHIP_CACHE_TTL = 60.0
+_MEMBERSHIP_CACHE_LOCK = threading.Lock()
+
+
+def invalidate_membership_cache(user_id: int, club_id: Optional[int] = None) -> None:
+    """Drop cached club authorizations for a user after a membership change.
+
+    With a club_id only that club's entry is dropped; without one every entry
+    for the user goes.
+    """
+
+    with _MEMBERSHIP_CACHE_LOCK:
+        if club_id is not None:
+            _MEMBERSHIP_CACHE.pop((user_id, club_id), None)
+            return
+        for key in [k for k in _MEMBERSHIP_CACHE if k[0] == user_id]:
+            del _MEMBERSHIP_CACHE[key]
+
+
+async def _state_writer(
+    table_id: int, ws: WebSocket, viewer_user_id: Optional[int], queue: asyncio.Queue
+) -> None:
+    """Drain a connection's queue, always sending the freshest snapshot."""
+
+    try:
+        while True:
+            payload = await queue.get()
+            await asyncio.wait_for(ws.send_text(payload), WS_SEND_TIMEOUT_SECONDS)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        unregister_ws(table_id, ws, viewer_user_id)
+
+
+def _enqueue_state(ws: WebSocket, payload: str) -> None:
+    """Queue a serialized snapshot for one socket, dropping any superseded entry."""
+
+    queue = _WS_QUEUES.get(ws)
+    if queue is None:
+        return
+    if _WS_LAST_SENT.get(ws) == payload:
+        return
+    _WS_LAST_SENT[ws] = payload
+    if queue.full():
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+    queue.put_nowait(payload)
+
+
+def _sweep_sitting_out_players(table_id: int) -> bool:
+    """Run one sit-out removal pass; returns True if any player was removed."""
+
+    engine_table = TABLES.get(table_id)
+    if engine_table is None:
+        return False
+
+    seated_before = len(engine_table.players)
+    db = SessionLocal()
+    try:
+        _auto_remove_sitting_out_players(table_id, engine_table, db)
+    finally:
+        db.close()
+    return len(engine_table.players) != seated_before
+
+
+async def _maintenance_loop(table_id: int) -> None:
+    """Periodically remove players whose sit-out grace period expired.
+
+    Runs while the table has open websockets, keeping the per-player grace
+    checks (and their DB work) off the broadcast hot path.
+    """
+
+    while True:
+        await asyncio.sleep(SIT_OUT_SWEEP_INTERVAL_SECONDS)
+        # The sweep removes players, so it must hold the table lock like
+        # every other engine mutation running on a worker thread.
+        async with _TABLE_LOCKS[table_id]:
+            removed_any = await run_in_threadpool(
+                _sweep_sitting_out_players, table_id
+            )
+        if removed_any:
+            await broadcast_table_state(table_id)
+
+
+def register_ws(table_id: int, ws: WebSocket, viewer_user_id: Optional[int]) -> None:
+    """Track a websocket (and its viewer, if authenticated) for a table."""
+
+    with _REGISTRY_LOCK:
+        TABLE_CONNECTIONS[table_id][ws] = viewer_user_id
+        if viewer_user_id is not None:
+            USER_CONNECTIONS.setdefault(viewer_user_id, set()).add(ws)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        _WS_QUEUES[ws] = queue
+        _WS_WRITERS[ws] = asyncio.create_task(
+            _state_writer(table_id, ws, viewer_user_id, queue)
+        )
+        if table_id not in _MAINTENANCE_TASKS:
+            _MAINTENANCE_TASKS[table_id] = asyncio.create_task(
+                _maintenance_loop(table_id)
+            )
+
+
+def unregister_ws(table_id: int, ws: WebSocket, viewer_user_id: Optional[int]) -> None:
+    """Remove a websocket from the registries, dropping empty buckets."""
+
+    maintenance = None
+    with _REGISTRY_LOCK:
+        connections = TABLE_CONNECTIONS.get(table_id)
+        if connections is not None:
+            connections.pop(ws, None)
+            if not connections:
+                del TABLE_CONNECTIONS[table_id]
+                maintenance = _MAINTENANCE_TASKS.pop(table_id, None)
+
+        if viewer_user_id is not None:
+            sockets = USER_CONNECTIONS.get(viewer_user_id)
+            if sockets is not None:
+                sockets.discard(ws)
+                if not sockets:
+                    del USER_CONNECTIONS[viewer_user_id]
+
+        _WS_QUEUES.pop(ws, None)
+        _WS_LAST_SENT.pop(ws, None)
+        writer = _WS_WRITERS.pop(ws, None)
+
+    if writer is not None and writer is not asyncio.current_task():
+        writer.cancel()
+    if maintenance is not None:
+        maintenance.cancel()
+
+def close_table_connections(table_id: int) -> None:
+    """Tear down a closed table's socket registry and background tasks.
+
+    ``unregister_ws`` only cancels the sweep task when it empties the bucket
+    itself, so a wholesale close must drop every socket's bookkeeping and
+    cancel the maintenance task explicitly — all under the registry lock.
+    Callers run on threadpool workers, so task cancellation is marshalled
+    onto the event loop instead of being invoked cross-thread.
+    """
+
+    tasks: list[asyncio.Task] = []
+    with _REGISTRY_LOCK:
+        connections = TABLE_CONNECTIONS.pop(table_id, None) or {}
+        maintenance = _MAINTENANCE_TASKS.pop(table_id, None)
+        if maintenance is not None:
+            tasks.append(maintenance)
+
+        for ws, viewer_user_id in connections.items():
+            if viewer_user_id is not None:
+                sockets = USER_CONNECTIONS.get(viewer_user_id)
+                if sockets is not None:
+                    sockets.discard(ws)
+                    if not sockets:
+                        del USER_CONNECTIONS[viewer_user_id]
+            _WS_QUEUES.pop(ws, None)
+            _WS_LAST_SENT.pop(ws, None)
+            writer = _WS_WRITERS.pop(ws, None)
+            if writer is not None:
+                tasks.append(writer)
+
+    for task in tasks:
+        task.get_loop().call_soon_threadsafe(task.cancel)
+
+    _TABLE_LOCKS.pop(table_id, None)
+
+
+# Signature of the last persisted stack snapshot per table so broadcasts can
+# skip the persistence round-trip entirely when nothing changed.
+_STACK_SIGNATURES: Dict[int, int] = {}
+
+# Engine-table version captured by the most recent broadcast, so callers can
+# tell whether viewers have already seen the current state.
+_LAST_BROADCAST_VERSIONS: Dict[int, int] = {}
+
+
+def table_state_stale(table_id: int) -> bool:
+    """True when the engine state has mutated since the last broadcast."""
+
+    engine_table = TABLES.get(table_id)
+    if engine_table is None:
+        return True
+    return _LAST_BROADCAST_VERSIONS.get(table_id) != engine_table.version
+
 
 @router.get("/online-count")
 def get_online_player_count(current_user: models.User = Depends(get_current_user)):
@@ -32,7 +272,8 @@ def get_online_player_count(current_user: models.User = Depends(get_current_user
     yet.
     """
 
-    unique_players = set(USER_CONNECTIONS.keys())
+    with _REGISTRY_LOCK:
+        unique_players = set(USER_CONNECTIONS.keys())
     if current_user and current_user.id is not None:
         unique_players.add(current_user.id)
     return {"online_players": len(unique_players)}
@@ -46,23 +287,32 @@ def _get_engine_table(table_id: int, db: Session | None = None) -> Table:
     if db is None:
         raise HTTPException(status_code=404, detail="Engine table not found")
 
-    table_meta = db.query(models.PokerTable).filter(models.PokerTable.id == table_id).first()
+    table_meta = db.get(models.PokerTable, table_id)
     if not table_meta:
         raise HTTPException(status_code=404, detail="Table not found")
 
     if table_meta.status == "closed":
         raise HTTPException(status_code=400, detail="Table is closed")
 
-    table = Table(
-        max_seats=table_meta.max_seats,
-        small_blind=table_meta.small_blind,
-        big_blind=table_meta.big_blind,
-        bomb_pot_every_n_hands=table_meta.bomb_pot_every_n_hands,
-        bomb_pot_amount=table_meta.bomb_pot_amount,
-        game_type=table_meta.game_type,
-    )
-    TABLES[table_id] = table
-    _restore_persisted_stacks(table_id, table, db)
+    # Hydration runs on threadpool workers; without the lock two concurrent
+    # first-requests could each build a Table and one would clobber the
+    # other's seats. Restore stacks before publishing so nobody observes a
+    # half-hydrated table.
+    with _REGISTRY_LOCK:
+        table = TABLES.get(table_id)
+        if table:
+            return table
+
+        table = Table(
+            max_seats=table_meta.max_seats,
+            small_blind=table_meta.small_blind,
+            big_blind=table_meta.big_blind,
+            bomb_pot_every_n_hands=table_meta.bomb_pot_every_n_hands,
+            bomb_pot_amount=table_meta.bomb_pot_amount,
+            game_type=table_meta.game_type,
+        )
+        _restore_persisted_stacks(table_id, table, db)
+        TABLES[table_id] = table
     return table
 
 
@@ -76,7 +326,7 @@ def _restore_persisted_stacks(table_id: int, engine_table: Table, db: Session) -
     )
 
     for row in persisted:
-        user = db.query(models.User).filter(models.User.id == row.user_id).first()
+        user = db.get(models.User, row.user_id)
         display_name = row.name or (user.username if user else "Player")
         profile_picture = row.profile_picture_url or (user.profile_picture_url if user else None)
 
@@ -107,86 +357,192 @@ def _ensure_user_in_table_club(
     db: Session,
     current_user: models.User,
 ) -> models.PokerTable:
-    table_meta = db.query(models.PokerTable).filter(models.PokerTable.id == table_id).first()
+    table_meta = db.get(models.PokerTable, table_id)
     if not table_meta:
         raise HTTPException(status_code=404, detail="Table not found")
-
     table_meta = _close_table_if_expired(table_meta, db)
 
-    club = table_meta.club
-    is_owner = is_club_owner(db, club.id, current_user.id)
-    is_member = (
-        db.query(models.ClubMember)
+    cache_key = (current_user.id, table_meta.club_id)
+    now = time.monotonic()
+    with _MEMBERSHIP_CACHE_LOCK:
+        cached_at = _MEMBERSHIP_CACHE.get(cache_key)
+        if cached_at is not None and now - cached_at >= _MEMBERSHIP_CACHE_TTL:
+            del _MEMBERSHIP_CACHE[cache_key]
+            cached_at = None
+
+    if cached_at is not None:
+        return table_meta
+
+    # Owners are approved members with the "owner" role, so a single
+    # membership check authorizes both cases that used to be two separate
+    # queries (plus a lazy club load).
+    membership_id = (
+        db.query(models.ClubMember.id)
         .filter(
-            models.ClubMember.club_id == club.id,
+            models.ClubMember.club_id == table_meta.club_id,
             models.ClubMember.user_id == current_user.id,
             models.ClubMember.status == "approved",
         )
-        .first()
-        is not None
+        .scalar()
     )
-    if not (is_owner or is_member):
+    if membership_id is None:
         raise HTTPException(status_code=403, detail="Not a member of this club")
 
+    with _MEMBERSHIP_CACHE_LOCK:
+        _MEMBERSHIP_CACHE[cache_key] = now
+
     return table_meta
 
 
-def _table_state_for_viewer(
+# Masked hole-card lists by hand size (0..4 cards covers both NLH and PLO),
+# so masking a hand is an index instead of a fresh list allocation.
+_MASKED_HOLE_CARDS = [["XX"] * n for n in range(5)]
+
+
+def _player_payload(p, viewer_user_id: Optional[int]) -> dict:
+    """Serialize one seat for the websocket payload, omitting default fields.
+
+    The frontend treats absent flags as falsy, so default-state seats only
+    ship the core fields. ``in_hand`` and ``committed`` stay unconditional:
+    the client distinguishes missing from False for the former and does
+    arithmetic on the latter.
+    """
+
+    payload = {
+        "id": p.id,
+        "name": p.name,
+        "seat": p.seat,
+        "stack": p.stack,
+        "committed": p.committed,
+        "in_hand": p.in_hand,
+        "hole_cards": (
+            p.hole_strs
+            if (p.user_id is None or p.user_id == viewer_user_id)
+            else _MASKED_HOLE_CARDS[len(p.hole_strs)]
+        ),
+    }
+    if p.sitting_out:
+        payload["sitting_out"] = True
+    if p.has_folded:
+        payload["has_folded"] = True
+    if p.all_in:
+        payload["all_in"] = True
+    if p.user_id is not None:
+        payload["user_id"] = p.user_id
+    if p.profile_picture_url:
+        payload["profile_picture_url"] = p.profile_picture_url
+    return payload
+
+
+def _build_state_dict(
     table_id: int,
     engine_table: Table,
     viewer_user_id: Optional[int],
-) -> schemas.TableState:
-    return schemas.TableState(
-        id=table_id,
-        hand_number=engine_table.hand_number,
-        street=engine_table.street,
-        pot=engine_table.pot,
-        board=[str(c) for c in engine_table.board],
-        current_bet=engine_table.current_bet,
-        next_to_act_seat=engine_table.next_to_act_seat,
-        action_deadline=engine_table.action_deadline,
-        dealer_button_seat=engine_table.dealer_button_seat,
-        small_blind_seat=engine_table.small_blind_seat,
-        big_blind_seat=engine_table.big_blind_seat,
-        small_blind=engine_table.small_blind,
-        big_blind=engine_table.big_blind,
-        game_type=engine_table.game_type,
-        players=[
-            schemas.PlayerState(
-                id=p.id,
-                name=p.name,
-                seat=p.seat,
-                stack=p.stack,
-                committed=p.committed,
-                sitting_out=getattr(p, "sitting_out", False),
-                in_hand=p.in_hand,
-                has_folded=p.has_folded,
-                all_in=p.all_in,
-                hole_cards=(
-                    [str(c) for c in p.hole_cards]
-                    if (p.user_id is None or p.user_id == viewer_user_id)
-                    else ["XX"] * len(p.hole_cards)
-                ),
-                user_id=p.user_id,
-                profile_picture_url=p.profile_picture_url,
-            )
-            for p in engine_table.players
+) -> dict:
+    """Build the table-state payload as a plain dict for websocket sends.
+
+    The data originates from the trusted in-memory engine, so the broadcast
+    hot path skips pydantic model construction and validation entirely. The
+    pydantic ``TableState`` model remains in use on the REST paths where the
+    OpenAPI schema matters.
+    """
+
+    return {
+        "id": table_id,
+        "hand_number": engine_table.hand_number,
+        "street": engine_table.street,
+        "pot": engine_table.pot,
+        "board": engine_table.board_strs,
+        "current_bet": engine_table.current_bet,
+        "next_to_act_seat": engine_table.next_to_act_seat,
+        "action_deadline": engine_table.action_deadline,
+        "dealer_button_seat": engine_table.dealer_button_seat,
+        "small_blind_seat": engine_table.small_blind_seat,
+        "big_blind_seat": engine_table.big_blind_seat,
+        "small_blind": engine_table.small_blind,
+        "big_blind": engine_table.big_blind,
+        "game_type": engine_table.game_type,
+        "players": [
+            _player_payload(p, viewer_user_id) for p in engine_table.players
         ],
-        recent_hands=engine_table.recent_hands,
+        "recent_hands": engine_table.recent_hands,
+    }
+
+
+# Serialized state payloads keyed by table, holding (engine version, masked
+# base dict, {folded viewer id: serialized str}). Entries self-invalidate
+# when the version moves on; REST responses and the websocket fan-out share
+# the cache, so repeated reads of the same hand state serialize nothing.
+# Only touched from the event loop, like the broadcast bookkeeping.
+_STATE_CACHE: Dict[int, Tuple[int, dict, Dict[Optional[int], str]]] = {}
+
+
+def _serialized_state(
+    table_id: int, engine_table: Table, viewer_user_id: Optional[int]
+) -> str:
+    """Return the viewer's serialized table state, cached per engine version.
+
+    The payload only varies by which hole cards are unmasked, so the masked
+    base dict is built once per version; each seated viewer reuses it with a
+    shallow-copied players list in which only their own seat's entry is
+    patched to reveal cards. Spectators and unseated viewers share the
+    ``None`` serialization.
+    """
+
+    cached = _STATE_CACHE.get(table_id)
+    if cached is None or cached[0] != engine_table.version:
+        cached = (
+            engine_table.version,
+            _build_state_dict(table_id, engine_table, None),
+            {},
+        )
+        _STATE_CACHE[table_id] = cached
+    _, base_state, per_viewer = cached
+
+    own = (
+        engine_table.player_for_user(viewer_user_id)
+        if viewer_user_id is not None
+        else None
     )
+    if own is None:
+        viewer_user_id = None
+
+    state = per_viewer.get(viewer_user_id)
+    if state is None:
+        payload = base_state
+        if own is not None:
+            payload = {
+                **base_state,
+                "players": [
+                    {**pl, "hole_cards": own.hole_strs}
+                    if pl.get("user_id") == viewer_user_id
+                    else pl
+                    for pl in base_state["players"]
+                ],
+            }
+        state = orjson.dumps(payload).decode()
+        per_viewer[viewer_user_id] = state
+    return state
 
 
 def _table_state(
     table_id: int, engine_table: Table, viewer_user_id: Optional[int] = None
-) -> schemas.TableState:
-    return _table_state_for_viewer(table_id, engine_table, viewer_user_id=viewer_user_id)
+) -> Response:
+    """JSON response for a viewer, served from the per-version state cache.
+
+    The routes keep ``response_model=schemas.TableState`` for the OpenAPI
+    schema; returning a Response bypasses pydantic construction and reuses
+    the exact serialization the websocket fan-out sends.
+    """
+
+    return Response(
+        content=_serialized_state(table_id, engine_table, viewer_user_id),
+        media_type="application/json",
+    )
 
 
 def _player_for_user(engine_table: Table, user_id: int):
-    for player in engine_table.players:
-        if player.user_id == user_id:
-            return player
-    return None
+    return engine_table.player_for_user(user_id)
 
 
 def _active_session(table_id: int, user_id: int, db: Session):
@@ -214,20 +570,44 @@ def _finalize_session(table_id: int, user_id: int, cash_out: float, db: Session)
     db.add(session)
 
 
+def _credit_balances(db: Session, credits: Dict[int, float]) -> None:
+    """Credit several users' balances with one UPDATE instead of a query per user.
+
+    Callers are responsible for committing; user ids without a matching row
+    are silently skipped, matching the previous per-user lookup behaviour.
+    """
+
+    if not credits:
+        return
+
+    if len(credits) == 1:
+        user_id, amount = next(iter(credits.items()))
+        db.query(models.User).filter(models.User.id == user_id).update(
+            {"balance": models.User.balance + amount}, synchronize_session=False
+        )
+        return
+
+    db.execute(
+        update(models.User)
+        .where(models.User.id.in_(credits))
+        .values(balance=models.User.balance + case(credits, value=models.User.id))
+        .execution_options(synchronize_session=False)
+    )
+
+
 def _generate_table_report(
     table_meta: models.PokerTable, db: Session, engine_table: Table | None = None
 ) -> Optional[models.TableReport]:
     engine_table = engine_table or TABLES.get(table_meta.id)
 
     if engine_table:
+        credits: Dict[int, float] = {}
         for player in engine_table.players:
             if player.user_id is None:
                 continue
             _finalize_session(table_meta.id, player.user_id, player.stack, db)
-            user = db.query(models.User).filter(models.User.id == player.user_id).first()
-            if user:
-                user.balance += int(round(player.stack))
-                db.add(user)
+            credits[player.user_id] = int(round(player.stack))
+        _credit_balances(db, credits)
 
     db.commit()
 
@@ -245,7 +625,6 @@ def _generate_table_report(
     )
     db.add(report)
     db.commit()
-    db.refresh(report)
 
     for session in sessions:
         cash_out = session.cash_out if session.cash_out is not None else 0
@@ -269,17 +648,24 @@ def _generate_table_report(
 
 def _close_table(table_meta: models.PokerTable, db: Session):
     engine_table = TABLES.pop(table_meta.id, None)
+    _STACK_SIGNATURES.pop(table_meta.id, None)
+    _LAST_BROADCAST_VERSIONS.pop(table_meta.id, None)
+    _STATE_CACHE.pop(table_meta.id, None)
     _generate_table_report(table_meta, db, engine_table)
     table_meta.status = "closed"
     db.add(table_meta)
     db.commit()
 
 
-def _close_table_if_expired(table_meta: models.PokerTable, db: Session):
+def _close_table_if_expired(
+    table_meta: models.PokerTable, db: Session, now: datetime | None = None
+):
     if table_meta.status != "active":
         return table_meta
 
-    if table_meta.created_at < datetime.utcnow() - TABLE_EXPIRY:
+    # Cheap timestamp comparison first; callers that loop over tables pass a
+    # shared `now` so the clock is read once per request.
+    if table_meta.created_at < (now or datetime.utcnow()) - TABLE_EXPIRY:
         _close_table(table_meta, db)
     return table_meta
 
@@ -290,7 +676,7 @@ def _auto_remove_sitting_out_players(
     """Remove players who have been sitting out longer than the grace period."""
 
     cutoff = time.time() - SIT_OUT_AUTO_LEAVE_SECONDS
-    any_updates = False
+    credits: Dict[int, float] = {}
 
     for player in list(engine_table.players):
         if not getattr(player, "sitting_out", False):
@@ -308,16 +694,11 @@ def _auto_remove_sitting_out_players(
         except ValueError:
             continue
 
-        user = db.query(models.User).filter(models.User.id == player.user_id).first()
-        if user:
-            user.balance += removed.stack
-            db.add(user)
-            any_updates = True
-
+        credits[player.user_id] = removed.stack
         _finalize_session(table_id, player.user_id, removed.stack, db)
-        any_updates = True
 
-    if any_updates:
+    if credits:
+        _credit_balances(db, credits)
         db.commit()
 
 
@@ -327,22 +708,40 @@ def close_table_and_report(table_meta: models.PokerTable, db: Session):
 
 def _apply_timeouts(table_id: int, db: Session | None = None) -> Table:
     engine_table = _get_engine_table(table_id, db)
+    # Cheap guard first: the scheduled timer (see _schedule_action_timeout)
+    # handles punctual enforcement, so request handlers only pay the
+    # enforcement loop when a deadline has actually lapsed.
+    deadline = engine_table.action_deadline
+    if deadline is None or time.time() < deadline:
+        return engine_table
     while True:
         result = engine_table.enforce_action_timeout()
         if result is None:
             break
-    if db is not None:
-        _auto_remove_sitting_out_players(table_id, engine_table, db)
     return engine_table
 
 
-def _auto_progress_hand(engine_table: Table) -> bool:
+# Dealer method that advances each street, replacing if/elif chains over
+# engine_table.street on the action hot path; streets absent from the map
+# (river, showdown, prehand) fall through to their own handling.
+_NEXT_STREET_DEAL = {"preflop": "deal_flop", "flop": "deal_turn", "turn": "deal_river"}
+
+
+def _auto_progress_hand(
+    engine_table: Table, snapshot: TableSnapshot | None = None
+) -> bool:
     """
     Advance the hand automatically when possible.
 
     Returns True if the hand reached showdown (finished), else False.
+    Callers that already hold a fresh ``Table.snapshot()`` can pass it in to
+    avoid re-scanning the player list.
     """
-    remaining = [p for p in engine_table.active_players() if not p.has_folded]
+    if snapshot is None:
+        snapshot = engine_table.snapshot()
+    remaining = snapshot.contenders
+    all_all_in = snapshot.all_all_in
+
     if len(remaining) == 1 and engine_table.street != "showdown":
         winner = remaining[0]
         pot_before = engine_table.pot
@@ -354,6 +753,10 @@ def _auto_progress_hand(engine_table: Table) -> bool:
         engine_table._finalize_hand(
             [winner], {winner.id: pot_before}, pot_before, reason="all_folded"
         )
+        # The payout and street change happened outside the engine's own
+        # mutators, so bump here; a snapshot raced mid-branch caches under
+        # the pre-payout version and self-invalidates.
+        engine_table.version += 1
         return True
 
     if engine_table.street == "showdown":
@@ -361,25 +764,16 @@ def _auto_progress_hand(engine_table: Table) -> bool:
 
     if engine_table.next_to_act_seat is None and engine_table.betting_round_complete():
         try:
-            if remaining and all(p.all_in for p in remaining):
-                if engine_table.street == "preflop":
-                    engine_table.deal_flop()
-                    engine_table.deal_turn()
-                    engine_table.deal_river()
-                elif engine_table.street == "flop":
-                    engine_table.deal_turn()
-                    engine_table.deal_river()
-                elif engine_table.street == "turn":
-                    engine_table.deal_river()
+            if remaining and all_all_in:
+                # Run the remaining streets out from wherever the hand stands.
+                while engine_table.street in _NEXT_STREET_DEAL:
+                    getattr(engine_table, _NEXT_STREET_DEAL[engine_table.street])()
                 engine_table.showdown()
                 return True
 
-            if engine_table.street == "preflop":
-                engine_table.deal_flop()
-            elif engine_table.street == "flop":
-                engine_table.deal_turn()
-            elif engine_table.street == "turn":
-                engine_table.deal_river()
+            deal = _NEXT_STREET_DEAL.get(engine_table.street)
+            if deal is not None:
+                getattr(engine_table, deal)()
             elif engine_table.street == "river":
                 engine_table.showdown()
                 return True
@@ -440,7 +834,7 @@ def _process_pending_leavers(table_id: int, engine_table: Table, db: Session) ->
         return
 
     pending_ids = list(engine_table.pending_leave_user_ids)
-    any_updates = False
+    credits: Dict[int, float] = {}
 
     for user_id in pending_ids:
         try:
@@ -449,24 +843,34 @@ def _process_pending_leavers(table_id: int, engine_table: Table, db: Session) ->
             engine_table.pending_leave_user_ids.discard(user_id)
             continue
 
-        user = db.query(models.User).filter(models.User.id == user_id).first()
-        if user:
-            user.balance += removed.stack
-            db.add(user)
-            any_updates = True
-
         if user_id is not None:
+            credits[user_id] = removed.stack
             _finalize_session(table_id, user_id, removed.stack, db)
-            any_updates = True
 
         engine_table.pending_leave_user_ids.discard(user_id)
 
-    if any_updates:
+    if credits:
+        _credit_balances(db, credits)
         db.commit()
 
 
 def _persist_table_stacks(table_id: int, engine_table: Table, db: Session) -> None:
-    """Store current in-play stacks so they survive server restarts."""
+    """Store current in-play stacks so they survive server restarts.
+
+    Called from every broadcast, so we fingerprint the persistable state and
+    return without touching the database when nothing has changed since the
+    last write.
+    """
+
+    signature = hash(
+        tuple(
+            (p.user_id, int(round(p.stack)), p.seat, p.name, p.profile_picture_url)
+            for p in engine_table.players
+            if p.user_id is not None
+        )
+    )
+    if _STACK_SIGNATURES.get(table_id) == signature:
+        return
 
     existing = {
         row.user_id: row
@@ -480,11 +884,21 @@ def _persist_table_stacks(table_id: int, engine_table: Table, db: Session) -> No
             continue
 
         seen_user_ids.add(player.user_id)
+        stack = int(round(player.stack))
         row = existing.get(player.user_id)
+        if (
+            row
+            and row.stack == stack
+            and row.seat == player.seat
+            and row.name == player.name
+            and row.profile_picture_url == player.profile_picture_url
+        ):
+            continue
+
         if not row:
             row = models.TableStack(table_id=table_id, user_id=player.user_id)
 
-        row.stack = int(round(player.stack))
+        row.stack = stack
         row.seat = player.seat
         row.name = player.name
         row.profile_picture_url = player.profile_picture_url
@@ -495,12 +909,73 @@ def _persist_table_stacks(table_id: int, engine_table: Table, db: Session) -> No
             db.delete(row)
 
     db.commit()
+    _STACK_SIGNATURES[table_id] = signature
+
+
+def _complete_buy_in(table_id: int, user: models.User, buy_in: int, db: Session) -> bool:
+    """Debit the buy-in and open a table session (blocking, threadpool-safe).
+
+    The debit is one conditional UPDATE, so two concurrent buy-ins cannot
+    both pass a stale read-then-write balance check. Returns False when the
+    balance no longer covers the buy-in.
+    """
+
+    debited = (
+        db.query(models.User)
+        .filter(models.User.id == user.id, models.User.balance >= buy_in)
+        .update({"balance": models.User.balance - buy_in}, synchronize_session=False)
+    )
+    if not debited:
+        db.rollback()
+        return False
+
+    session = models.TableSession(table_id=table_id, user_id=user.id, buy_in=buy_in)
+    db.add(session)
+    db.commit()
+    db.refresh(user)
+    return True
+
+
+def _cash_out_seat(
+    table_id: int, user_id: int, stack: float, db: Session
+) -> Optional[models.User]:
+    """Credit a leaving player's stack and close their session (blocking)."""
+
+    user = db.get(models.User, user_id)
+    if not user:
+        return None
+
+    # Credit server-side so concurrent balance writes (top-ups, other cash
+    # outs) cannot be lost to a read-modify-write race.
+    db.query(models.User).filter(models.User.id == user_id).update(
+        {"balance": models.User.balance + stack}, synchronize_session=False
+    )
+    _finalize_session(table_id, user_id, stack, db)
+    db.commit()
+    db.refresh(user)
+    return user
 
 
-def _auto_start_hand_if_ready(engine_table: Table) -> bool:
+def _after_hand_bookkeeping(
+    table_meta: models.PokerTable, table_id: int, engine_table: Table, db: Session
+) -> None:
+    """Persist hand history and stand up pending leavers once a hand ends."""
+
+    _record_hand_history(table_meta, engine_table, db)
+    _process_pending_leavers(table_id, engine_table, db)
+
+
+def _auto_start_hand_if_ready(
+    engine_table: Table, snapshot: TableSnapshot | None = None
+) -> bool:
     """Start a fresh hand when at least two players are seated."""
-    active_players = [p for p in engine_table.players if not getattr(p, "sitting_out", False)]
-    if len(active_players) < 2:
+    if snapshot is not None:
+        ready_count = snapshot.ready_count
+    else:
+        ready_count = sum(
+            1 for p in engine_table.players if not getattr(p, "sitting_out", False)
+        )
+    if ready_count < 2:
         return False
 
     if engine_table.street not in {"prehand", "showdown"}:
@@ -510,49 +985,203 @@ def _auto_start_hand_if_ready(engine_table: Table) -> bool:
     return True
 
 
-async def broadcast_table_state(table_id: int):
-    # Broadcasts assume the engine table already exists; callers should
-    # ensure it is initialized before invoking this function.
-    engine_table = _get_engine_table(table_id)
-    player_user_ids: Set[int] = set()
-    connections: Dict[WebSocket, Optional[int]] = {}
-    sent: Set[WebSocket] = set()
+def _refresh_table_state(table_id: int, engine_table: Table) -> None:
+    """Enforce lapsed timeouts and advance the hand (blocking).
+
+    For callers that cannot know whether the engine state is current — the
+    websocket connect path and the timeout timer. The mutating endpoints
+    drive progression themselves, so plain broadcasts skip this entirely.
+    """
+
     db = SessionLocal()
     try:
         _apply_timeouts(table_id, db)
-        _auto_progress_hand(engine_table)
-        _auto_start_hand_if_ready(engine_table)
+        snapshot = engine_table.snapshot()
+        _auto_progress_hand(engine_table, snapshot)
+        _auto_start_hand_if_ready(engine_table, snapshot)
+    finally:
+        db.close()
+
+
+def _persist_stacks_if_changed(table_id: int, engine_table: Table) -> None:
+    """Persist in-play stacks, opening a session only when they changed."""
+
+    signature = hash(
+        tuple(
+            (p.user_id, int(round(p.stack)), p.seat, p.name, p.profile_picture_url)
+            for p in engine_table.players
+            if p.user_id is not None
+        )
+    )
+    if _STACK_SIGNATURES.get(table_id) == signature:
+        return
+
+    db = SessionLocal()
+    try:
         _persist_table_stacks(table_id, engine_table, db)
-        connections = TABLE_CONNECTIONS.get(table_id, {})
-        player_user_ids = {p.user_id for p in engine_table.players if p.user_id is not None}
-
-        # First notify anyone subscribed to the specific table
-        for ws, viewer_user_id in list(connections.items()):
-            try:
-                state = _table_state_for_viewer(table_id, engine_table, viewer_user_id)
-                await ws.send_json(state.dict())
-                sent.add(ws)
-            except Exception:
-                connections.pop(ws, None)
     finally:
         db.close()
 
+
+async def refresh_and_broadcast(table_id: int) -> None:
+    """Bring the engine state current, then fan it out."""
+
+    engine_table = _get_engine_table(table_id)
+    async with _TABLE_LOCKS[table_id]:
+        await run_in_threadpool(_refresh_table_state, table_id, engine_table)
+    await broadcast_table_state(table_id)
+
+
+def _fire_action_timeout(table_id: int) -> None:
+    """Timer callback: refresh so the lapsed deadline gets enforced."""
+
+    _TIMEOUT_HANDLES.pop(table_id, None)
+    if table_id in TABLES:
+        asyncio.ensure_future(refresh_and_broadcast(table_id))
+
+
+def _schedule_action_timeout(table_id: int, engine_table: Table) -> None:
+    """(Re)arm the timer for the current actor's deadline.
+
+    Runs on the event loop at the end of every broadcast. The broadcast
+    refresh applies the timeout and advances the hand, so the fired timer
+    only needs to trigger another broadcast.
+    """
+
+    handle = _TIMEOUT_HANDLES.pop(table_id, None)
+    if handle is not None:
+        handle.cancel()
+
+    deadline = engine_table.action_deadline
+    if deadline is None:
+        return
+
+    # action_deadline is wall-clock epoch seconds; convert to a loop delay
+    # with a small margin so the deadline has lapsed when the timer fires.
+    delay = max(deadline - time.time(), 0.0) + 0.05
+    _TIMEOUT_HANDLES[table_id] = asyncio.get_running_loop().call_later(
+        delay, _fire_action_timeout, table_id
+    )
+
+
+async def broadcast_table_state(table_id: int):
+    """Send the current state to every connected socket, without mutating it.
+
+    The mutating endpoints progress the hand themselves before publishing,
+    so the broadcast no longer repeats that engine work per send; stack
+    persistence stays here because stacks change on many paths, and its
+    fingerprint check makes the common no-change case free.
+    """
+
+    # Broadcasts assume the engine table already exists; callers should
+    # ensure it is initialized before invoking this function.
+    engine_table = _get_engine_table(table_id)
+    sent: Set[WebSocket] = set()
+
+    # Record the version up front: mutations landing mid-fan-out leave the
+    # table stale and trigger their own publish anyway.
+    _LAST_BROADCAST_VERSIONS[table_id] = engine_table.version
+
+    snapshot = engine_table.snapshot()
+    await run_in_threadpool(_persist_stacks_if_changed, table_id, engine_table)
+
+    # Snapshot the registry under the lock, then send outside it so slow
+    # clients never hold up connect/disconnect bookkeeping.
+    with _REGISTRY_LOCK:
+        connections = TABLE_CONNECTIONS.get(table_id)
+        targets = list(connections.items()) if connections else []
+    player_user_ids = snapshot.user_ids
+
+    # Payloads come from the per-version state cache shared with the REST
+    # endpoints, so a broadcast for state a viewer already requested (or vice
+    # versa) serializes nothing. The serialized form is text, not bytes: the
+    # frontend JSON-parses TEXT frames and would receive a Blob for binary
+    # ones.
+    def _state_for(viewer_user_id: Optional[int]) -> str:
+        return _serialized_state(table_id, engine_table, viewer_user_id)
+
+    # First notify anyone subscribed to the specific table. Payloads are
+    # handed to each connection's bounded queue; the per-socket writer tasks
+    # drain them concurrently, and a burst of updates (e.g. an all-in runout)
+    # collapses to the latest snapshot for clients that cannot keep up.
+    for ws, viewer_user_id in targets:
+        _enqueue_state(ws, _state_for(viewer_user_id))
+        sent.add(ws)
+
     # Also notify any user-level websocket connections for seated players
     for user_id in player_user_ids:
-        sockets = USER_CONNECTIONS.get(user_id, set())
-        for ws in list(sockets):
-            if ws in sent:
-                continue
-            try:
-                state = _table_state_for_viewer(
-                    table_id, engine_table, viewer_user_id=user_id
-                )
-                await ws.send_json(state.dict())
-                sent.add(ws)
-            except Exception:
-                sockets.discard(ws)
+        with _REGISTRY_LOCK:
+            sockets = [ws for ws in USER_CONNECTIONS.get(user_id, ()) if ws not in sent]
         if not sockets:
-            USER_CONNECTIONS.pop(user_id, None)
+            continue
+        state = _state_for(user_id)
+        for ws in sockets:
+            _enqueue_state(ws, state)
+            sent.add(ws)
+
+    _schedule_action_timeout(table_id, engine_table)
+
+
+# Table ids awaiting fan-out. Endpoints enqueue here and return immediately;
+# the lifespan-started worker drains the queue, so REST latency no longer
+# includes the websocket sends. The pending set coalesces bursts — several
+# publishes before the worker gets scheduled produce a single broadcast.
+# Touched only from the event loop, so no lock is needed.
+_BROADCAST_QUEUE: "asyncio.Queue[int]" = asyncio.Queue()
+_PENDING_BROADCASTS: Set[int] = set()
+_BROADCASTER_TASK: Optional[asyncio.Task] = None
+
+
+async def _broadcast_worker() -> None:
+    """Drain the publish queue, one fan-out per distinct queued table."""
+
+    while True:
+        table_id = await _BROADCAST_QUEUE.get()
+        _PENDING_BROADCASTS.discard(table_id)
+        try:
+            await broadcast_table_state(table_id)
+        except Exception:
+            # Per-socket failures are handled inside the broadcast; anything
+            # else must not kill the drain loop for every table.
+            pass
+
+
+def start_broadcast_worker() -> None:
+    """Start the fan-out worker; called from the app lifespan."""
+
+    global _BROADCASTER_TASK
+    if _BROADCASTER_TASK is None or _BROADCASTER_TASK.done():
+        _BROADCASTER_TASK = asyncio.create_task(_broadcast_worker())
+
+
+def stop_broadcast_worker() -> None:
+    """Cancel the fan-out worker; called from the app lifespan."""
+
+    global _BROADCASTER_TASK
+    task, _BROADCASTER_TASK = _BROADCASTER_TASK, None
+    if task is not None:
+        task.cancel()
+
+
+async def publish_table_update(table_id: int) -> None:
+    """Announce that a table changed and fan the new state out to viewers.
+
+    Engine tables live in this process, so "publish" currently means feeding
+    the local broadcast worker. Mutating endpoints all go through this one
+    seam; a multi-worker deployment would swap its body for a message-bus
+    publish (e.g. Redis pub/sub) with each worker broadcasting to its own
+    sockets, without touching the endpoints.
+    """
+
+    if _BROADCASTER_TASK is None or _BROADCASTER_TASK.done():
+        # No worker running (app used without its lifespan, e.g. ad-hoc
+        # scripts): fall back to broadcasting inline.
+        await broadcast_table_state(table_id)
+        return
+
+    if table_id not in _PENDING_BROADCASTS:
+        _PENDING_BROADCASTS.add(table_id)
+        _BROADCAST_QUEUE.put_nowait(table_id)
 
 
 @router.get("/", response_model=list[schemas.PokerTableMeta])
@@ -562,19 +1191,45 @@ def list_my_tables(
 ):
     """List tables within clubs the user belongs to."""
 
-    tables = (
+    now = datetime.utcnow()
+    cutoff = now - TABLE_EXPIRY
+
+    # Any overdue tables still marked active need their reports generated
+    # before we answer; normally this query returns nothing.
+    expired = (
         db.query(models.PokerTable)
-        .join(models.Club, models.PokerTable.club_id == models.Club.id)
-        .join(models.ClubMember, models.ClubMember.club_id == models.Club.id)
+        .join(
+            models.ClubMember,
+            models.ClubMember.club_id == models.PokerTable.club_id,
+        )
         .filter(
             models.ClubMember.user_id == current_user.id,
             models.ClubMember.status == "approved",
             models.PokerTable.status == "active",
+            models.PokerTable.created_at < cutoff,
         )
         .all()
     )
+    for table in expired:
+        _close_table_if_expired(table, db, now=now)
 
-    tables = [table for table in tables if _close_table_if_expired(table, db).status == "active"]
+    # The expiry check lives in the WHERE clause, so no Python-side filter
+    # pass over the result is needed.
+    tables = (
+        db.query(models.PokerTable)
+        .join(
+            models.ClubMember,
+            models.ClubMember.club_id == models.PokerTable.club_id,
+        )
+        .filter(
+            models.ClubMember.user_id == current_user.id,
+            models.ClubMember.status == "approved",
+            models.PokerTable.status == "active",
+            models.PokerTable.created_at >= cutoff,
+        )
+        .distinct()
+        .all()
+    )
 
     return tables
 
@@ -585,7 +1240,7 @@ def create_table(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    club = db.query(models.Club).filter(models.Club.id == req.club_id).first()
+    club = db.get(models.Club, req.club_id)
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
 
@@ -614,13 +1269,11 @@ def create_table(
     )
     db.add(table_meta)
     db.commit()
-    db.refresh(table_meta)
 
     if not provided_name:
         table_meta.table_name = f"Table #{table_meta.id}"
         db.add(table_meta)
         db.commit()
-        db.refresh(table_meta)
 
     engine_table = Table(
         max_seats=req.max_seats,
@@ -647,13 +1300,15 @@ async def add_player(
     _ensure_user_in_table_club(table_id, db, current_user)
     engine_table = _get_engine_table(table_id, db)
 
-    player = engine_table.add_player(
-        name=req.name,
-        starting_stack=req.starting_stack,
-        user_id=None,
-        seat=req.seat,
-    )
-    await broadcast_table_state(table_id)
+    async with _TABLE_LOCKS[table_id]:
+        player = engine_table.add_player(
+            name=req.name,
+            starting_stack=req.starting_stack,
+            user_id=None,
+            seat=req.seat,
+        )
+        _auto_start_hand_if_ready(engine_table)
+    await publish_table_update(table_id)
     return schemas.AddPlayerResponse(table_id=table_id, player_id=player.id, seat=player.seat)
 
 
@@ -667,11 +1322,10 @@ async def sit_me(
     _ensure_user_in_table_club(table_id, db, current_user)
     engine_table = _get_engine_table(table_id, db)
 
-    for p in engine_table.players:
-        if p.user_id == current_user.id:
-            raise HTTPException(status_code=400, detail="User already seated at this table")
+    if engine_table.player_for_user(current_user.id) is not None:
+        raise HTTPException(status_code=400, detail="User already seated at this table")
 
-    user = db.query(models.User).filter(models.User.id == current_user.id).first()
+    user = db.get(models.User, current_user.id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -687,7 +1341,6 @@ async def sit_me(
         _finalize_session(table_id, current_user.id, existing_session.buy_in, db)
         db.add(user)
         db.commit()
-        db.refresh(user)
 
     if req.buy_in <= 0:
         raise HTTPException(status_code=400, detail="Buy-in must be positive")
@@ -695,25 +1348,26 @@ async def sit_me(
     if user.balance < req.buy_in:
         raise HTTPException(status_code=400, detail="Insufficient balance for buy-in")
 
-    try:
-        player = engine_table.add_player(
-            name=current_user.username,
-            starting_stack=req.buy_in,
-            user_id=current_user.id,
-            profile_picture_url=current_user.profile_picture_url,
-            seat=req.seat,
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    async with _TABLE_LOCKS[table_id]:
+        try:
+            player = engine_table.add_player(
+                name=current_user.username,
+                starting_stack=req.buy_in,
+                user_id=current_user.id,
+                profile_picture_url=current_user.profile_picture_url,
+                seat=req.seat,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-    user.balance -= req.buy_in
-    db.add(user)
-    session = models.TableSession(table_id=table_id, user_id=current_user.id, buy_in=req.buy_in)
-    db.add(session)
-    db.commit()
-    db.refresh(user)
+        debited = await run_in_threadpool(_complete_buy_in, table_id, user, req.buy_in, db)
+        if not debited:
+            engine_table.remove_player_by_user(current_user.id)
+            raise HTTPException(status_code=400, detail="Insufficient balance for buy-in")
 
-    await broadcast_table_state(table_id)
+        _auto_start_hand_if_ready(engine_table)
+
+    await publish_table_update(table_id)
     return schemas.AddPlayerResponse(table_id=table_id, player_id=player.id, seat=player.seat)
 
 
@@ -727,15 +1381,16 @@ async def change_seat(
     _ensure_user_in_table_club(table_id, db, current_user)
     engine_table = _get_engine_table(table_id, db)
 
-    if engine_table.street not in {"prehand", "showdown"}:
-        raise HTTPException(status_code=400, detail="You can only change seats between hands")
+    async with _TABLE_LOCKS[table_id]:
+        if engine_table.street not in {"prehand", "showdown"}:
+            raise HTTPException(status_code=400, detail="You can only change seats between hands")
 
-    try:
-        player = engine_table.move_player_to_seat(current_user.id, req.seat)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        try:
+            player = engine_table.move_player_to_seat(current_user.id, req.seat)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-    await broadcast_table_state(table_id)
+    await publish_table_update(table_id)
     return schemas.AddPlayerResponse(table_id=table_id, player_id=player.id, seat=player.seat)
 
 
@@ -756,36 +1411,33 @@ async def leave_table(
     if not player:
         raise HTTPException(status_code=404, detail="You are not seated at this table")
 
-    in_active_hand = (
-        engine_table.street not in ("prehand", "showdown")
-        and engine_table.next_to_act_seat is not None
-    )
-
-    if in_active_hand:
-        engine_table.pending_leave_user_ids.add(current_user.id)
-        return schemas.LeaveTableResponse(
-            table_id=table_id,
-            seat=player.seat,
-            returned_amount=None,
-            pending=True,
+    async with _TABLE_LOCKS[table_id]:
+        in_active_hand = (
+            engine_table.street not in ("prehand", "showdown")
+            and engine_table.next_to_act_seat is not None
         )
 
-    try:
-        removed = engine_table.remove_player_by_user(current_user.id)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        if in_active_hand:
+            engine_table.pending_leave_user_ids.add(current_user.id)
+            return schemas.LeaveTableResponse(
+                table_id=table_id,
+                seat=player.seat,
+                returned_amount=None,
+                pending=True,
+            )
 
-    user = db.query(models.User).filter(models.User.id == current_user.id).first()
+        try:
+            removed = engine_table.remove_player_by_user(current_user.id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        user = await run_in_threadpool(
+            _cash_out_seat, table_id, current_user.id, removed.stack, db
+        )
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    user.balance += removed.stack
-    db.add(user)
-    _finalize_session(table_id, current_user.id, removed.stack, db)
-    db.commit()
-    db.refresh(user)
-
-    await broadcast_table_state(table_id)
+    await publish_table_update(table_id)
 
     return schemas.LeaveTableResponse(
         table_id=table_id,
@@ -794,48 +1446,51 @@ async def leave_table(
     )
 
 
-@router.post("/{table_id}/sit_out", response_model=schemas.TableState)
+@router.post("/{table_id}/sit_out", response_model=schemas.TableState, response_model_exclude_none=True)
 async def sit_out(
     table_id: int,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
     table_meta = _ensure_user_in_table_club(table_id, db, current_user)
-    engine_table = _apply_timeouts(table_id, db)
+    async with _TABLE_LOCKS[table_id]:
+        engine_table = await asyncio.to_thread(_apply_timeouts, table_id, db)
 
-    player = _player_for_user(engine_table, current_user.id)
-    if not player:
-        raise HTTPException(status_code=404, detail="You are not seated at this table")
+        player = _player_for_user(engine_table, current_user.id)
+        if not player:
+            raise HTTPException(status_code=404, detail="You are not seated at this table")
 
-    engine_table.sit_out_player(player, auto=False, reason="manual")
+        engine_table.sit_out_player(player, auto=False, reason="manual")
 
-    hand_finished = _auto_progress_hand(engine_table)
-    if hand_finished:
-        _record_hand_history(table_meta, engine_table, db)
-        _process_pending_leavers(table_id, engine_table, db)
-        _auto_start_hand_if_ready(engine_table)
+        hand_finished = await asyncio.to_thread(_auto_progress_hand, engine_table)
+        if hand_finished:
+            await run_in_threadpool(
+                _after_hand_bookkeeping, table_meta, table_id, engine_table, db
+            )
+            _auto_start_hand_if_ready(engine_table)
 
-    await broadcast_table_state(table_id)
+    await publish_table_update(table_id)
     return _table_state(table_id, engine_table, viewer_user_id=current_user.id)
 
 
-@router.post("/{table_id}/return", response_model=schemas.TableState)
+@router.post("/{table_id}/return", response_model=schemas.TableState, response_model_exclude_none=True)
 async def return_to_play(
     table_id: int,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
     _ensure_user_in_table_club(table_id, db, current_user)
-    engine_table = _apply_timeouts(table_id, db)
+    async with _TABLE_LOCKS[table_id]:
+        engine_table = await asyncio.to_thread(_apply_timeouts, table_id, db)
 
-    player = _player_for_user(engine_table, current_user.id)
-    if not player:
-        raise HTTPException(status_code=404, detail="You are not seated at this table")
+        player = _player_for_user(engine_table, current_user.id)
+        if not player:
+            raise HTTPException(status_code=404, detail="You are not seated at this table")
 
-    engine_table.return_player_to_game(player)
-    _auto_start_hand_if_ready(engine_table)
+        engine_table.return_player_to_game(player)
+        _auto_start_hand_if_ready(engine_table)
 
-    await broadcast_table_state(table_id)
+    await publish_table_update(table_id)
     return _table_state(
         table_id,
         engine_table,
@@ -843,20 +1498,21 @@ async def return_to_play(
     )
 
 
-@router.post("/{table_id}/start_hand", response_model=schemas.TableState)
+@router.post("/{table_id}/start_hand", response_model=schemas.TableState, response_model_exclude_none=True)
 async def start_hand(
     table_id: int,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
     _ensure_user_in_table_club(table_id, db, current_user)
-    engine_table = _apply_timeouts(table_id, db)
-    engine_table.start_new_hand()
-    await broadcast_table_state(table_id)
+    async with _TABLE_LOCKS[table_id]:
+        engine_table = await asyncio.to_thread(_apply_timeouts, table_id, db)
+        await asyncio.to_thread(engine_table.start_new_hand)
+    await publish_table_update(table_id)
     return _table_state(table_id, engine_table, viewer_user_id=current_user.id)
 
 
-@router.post("/{table_id}/action", response_model=schemas.TableState)
+@router.post("/{table_id}/action", response_model=schemas.TableState, response_model_exclude_none=True)
 async def player_action(
     table_id: int,
     req: schemas.ActionRequest,
@@ -864,68 +1520,76 @@ async def player_action(
     current_user: models.User = Depends(get_current_user),
 ):
     table_meta = _ensure_user_in_table_club(table_id, db, current_user)
-    engine_table = _apply_timeouts(table_id, db)
-    try:
-        engine_table.player_action(req.player_id, req.action, req.amount)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-    hand_finished = _auto_progress_hand(engine_table)
-    if hand_finished:
-        _record_hand_history(table_meta, engine_table, db)
-        _process_pending_leavers(table_id, engine_table, db)
-        _auto_start_hand_if_ready(engine_table)
-    await broadcast_table_state(table_id)
+    async with _TABLE_LOCKS[table_id]:
+        engine_table = await asyncio.to_thread(_apply_timeouts, table_id, db)
+        try:
+            await asyncio.to_thread(
+                engine_table.player_action, req.player_id, req.action, req.amount
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        hand_finished = await asyncio.to_thread(_auto_progress_hand, engine_table)
+        if hand_finished:
+            await run_in_threadpool(
+                _after_hand_bookkeeping, table_meta, table_id, engine_table, db
+            )
+            _auto_start_hand_if_ready(engine_table)
+    await publish_table_update(table_id)
     return _table_state(table_id, engine_table, viewer_user_id=current_user.id)
 
 
-@router.post("/{table_id}/deal_flop", response_model=schemas.TableState)
+@router.post("/{table_id}/deal_flop", response_model=schemas.TableState, response_model_exclude_none=True)
 async def deal_flop(
     table_id: int,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
     _ensure_user_in_table_club(table_id, db, current_user)
-    engine_table = _apply_timeouts(table_id, db)
-    engine_table.deal_flop()
-    await broadcast_table_state(table_id)
+    async with _TABLE_LOCKS[table_id]:
+        engine_table = await asyncio.to_thread(_apply_timeouts, table_id, db)
+        await asyncio.to_thread(engine_table.deal_flop)
+    await publish_table_update(table_id)
     return _table_state(table_id, engine_table, viewer_user_id=current_user.id)
 
 
-@router.post("/{table_id}/deal_turn", response_model=schemas.TableState)
+@router.post("/{table_id}/deal_turn", response_model=schemas.TableState, response_model_exclude_none=True)
 async def deal_turn(
     table_id: int,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
     _ensure_user_in_table_club(table_id, db, current_user)
-    engine_table = _apply_timeouts(table_id, db)
-    engine_table.deal_turn()
-    await broadcast_table_state(table_id)
+    async with _TABLE_LOCKS[table_id]:
+        engine_table = await asyncio.to_thread(_apply_timeouts, table_id, db)
+        await asyncio.to_thread(engine_table.deal_turn)
+    await publish_table_update(table_id)
     return _table_state(table_id, engine_table, viewer_user_id=current_user.id)
 
 
-@router.post("/{table_id}/deal_river", response_model=schemas.TableState)
+@router.post("/{table_id}/deal_river", response_model=schemas.TableState, response_model_exclude_none=True)
 async def deal_river(
     table_id: int,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
     _ensure_user_in_table_club(table_id, db, current_user)
-    engine_table = _apply_timeouts(table_id, db)
-    engine_table.deal_river()
-    await broadcast_table_state(table_id)
+    async with _TABLE_LOCKS[table_id]:
+        engine_table = await asyncio.to_thread(_apply_timeouts, table_id, db)
+        await asyncio.to_thread(engine_table.deal_river)
+    await publish_table_update(table_id)
     return _table_state(table_id, engine_table, viewer_user_id=current_user.id)
 
 
-@router.get("/{table_id}", response_model=schemas.TableState)
+@router.get("/{table_id}", response_model=schemas.TableState, response_model_exclude_none=True)
 async def get_table_state(
     table_id: int,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
     _ensure_user_in_table_club(table_id, db, current_user)
-    engine_table = _apply_timeouts(table_id, db)
+    async with _TABLE_LOCKS[table_id]:
+        engine_table = await asyncio.to_thread(_apply_timeouts, table_id, db)
     return _table_state(table_id, engine_table, viewer_user_id=current_user.id)
 
 
@@ -948,12 +1612,15 @@ async def showdown(
 ):
     table_meta = _ensure_user_in_table_club(table_id, db, current_user)
     engine_table = _get_engine_table(table_id, db)
-    winners, best_rank, results, payouts = engine_table.showdown()
+    async with _TABLE_LOCKS[table_id]:
+        winners, best_rank, results, payouts = await asyncio.to_thread(
+            engine_table.showdown
+        )
 
-    # Wallet balances are reconciled when players leave the table. Avoid
-    # crediting winners here to prevent double-counting when they cash out.
-    started = _auto_start_hand_if_ready(engine_table)
-    await broadcast_table_state(table_id)
+        # Wallet balances are reconciled when players leave the table. Avoid
+        # crediting winners here to prevent double-counting when they cash out.
+        started = _auto_start_hand_if_ready(engine_table)
+    await publish_table_update(table_id)
 
     return {
         "winners": [
@@ -968,6 +1635,8 @@ async def showdown(
             for p in winners
         ],
         "best_rank": best_rank,
-        "table": _table_state(table_id, engine_table, viewer_user_id=current_user.id),
+        "table": orjson.loads(
+            _serialized_state(table_id, engine_table, current_user.id)
+        ),
         "auto_started": started,
     }
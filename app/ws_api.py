@@ -1,64 +1,178 @@
+import asyncio
+import hashlib
 import json
+import threading
+import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Optional, Tuple
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from jose import jwt
 
 from . import models
 from .tables_api import (
+    TABLES,
     TABLE_CONNECTIONS,
-    USER_CONNECTIONS,
     broadcast_table_state,
+    refresh_and_broadcast,
+    register_ws,
+    table_state_stale,
+    unregister_ws,
     _get_engine_table,
 )
 from .deps import SECRET_KEY, ALGORITHM
 from .database import SessionLocal
 
 ws_router = APIRouter()
-TABLE_CHAT_LOGS: Dict[int, List[dict]] = {}
+TABLE_CHAT_LOGS: Dict[int, Deque[dict]] = {}
+CHAT_LOG_LIMIT = 50
+# Chat logs are touched from the WS event loop today, but the append/trim
+# sequence is not atomic and nothing prevents a future threadpool caller;
+# guard mutations the same way tables_api guards its socket registries.
+_CHAT_LOG_LOCK = threading.Lock()
+
+# Successfully verified tokens, mapped to (user_id, cache expiry). The same
+# token arrives on every reconnect of a session, and each verification is a
+# full signature check; caching skips that for an hour at most, never past
+# the token's own exp claim. Failures are never cached. Keys are a 16-byte
+# BLAKE2 digest of the token's signature segment rather than the raw token:
+# the signature already commits to header+payload+secret, and a fixed-size
+# digest keeps the cache small and lookups cheap for kilobyte-long tokens.
+_TOKEN_CACHE: Dict[bytes, Tuple[Optional[int], float]] = {}
+_TOKEN_CACHE_TTL = 3600.0
+_TOKEN_CACHE_MAX = 4096
+_TOKEN_CACHE_LOCK = threading.Lock()
 
 
 def _get_user_id_from_token(token: Optional[str]) -> Optional[int]:
     if not token:
         return None
+
+    cache_key = hashlib.blake2b(
+        token.rsplit(".", 1)[-1].encode(), digest_size=16
+    ).digest()
+    now = time.time()
+    with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(cache_key)
+        if cached is not None:
+            user_id, valid_until = cached
+            if now < valid_until:
+                return user_id
+            del _TOKEN_CACHE[cache_key]
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         sub = payload.get("sub")
-        return int(sub) if sub is not None else None
+        user_id = int(sub) if sub is not None else None
     except Exception:
         return None
 
+    valid_until = now + _TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if exp is not None:
+        valid_until = min(valid_until, float(exp))
+    if valid_until > now:
+        with _TOKEN_CACHE_LOCK:
+            if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX:
+                _TOKEN_CACHE.clear()
+            _TOKEN_CACHE[cache_key] = (user_id, valid_until)
+    return user_id
+
+
+# Resolved usernames, mapped to (username, cache expiry). Every chat message
+# used to open a session and SELECT the sender's row; usernames effectively
+# never change mid-session, so a short TTL keeps the WS hot path off the
+# database. Only successful lookups are cached — the fallback varies per call.
+_USERNAME_CACHE: Dict[int, Tuple[str, float]] = {}
+_USERNAME_CACHE_TTL = 300.0
+_USERNAME_CACHE_MAX = 8192
+_USERNAME_CACHE_LOCK = threading.Lock()
+
 
 def _resolve_username(user_id: Optional[int], fallback: Optional[str] = None) -> str:
     if user_id is None:
         return fallback or "Spectator"
 
+    now = time.time()
+    with _USERNAME_CACHE_LOCK:
+        cached = _USERNAME_CACHE.get(user_id)
+        if cached is not None:
+            username, valid_until = cached
+            if now < valid_until:
+                return username
+            del _USERNAME_CACHE[user_id]
+
     db = SessionLocal()
     try:
-        user = db.query(models.User).filter(models.User.id == user_id).first()
-        if user and user.username:
-            return user.username
+        # Column-only select: the payload needs nothing but the name, so skip
+        # hydrating a full User instance.
+        username = (
+            db.query(models.User.username)
+            .filter(models.User.id == user_id)
+            .scalar()
+        )
     finally:
         db.close()
 
+    if username:
+        with _USERNAME_CACHE_LOCK:
+            if len(_USERNAME_CACHE) >= _USERNAME_CACHE_MAX:
+                _USERNAME_CACHE.clear()
+            _USERNAME_CACHE[user_id] = (username, now + _USERNAME_CACHE_TTL)
+        return username
+
     return fallback or "Player"
 
 
 def _append_chat_message(table_id: int, message: dict) -> None:
-    history = TABLE_CHAT_LOGS.setdefault(table_id, [])
-    history.append(message)
-    if len(history) > 50:
-        del history[:-50]
+    # A bounded deque drops the oldest entry in O(1); the old list-based
+    # version re-sliced the whole history on every message past the cap.
+    with _CHAT_LOG_LOCK:
+        TABLE_CHAT_LOGS.setdefault(
+            table_id, deque(maxlen=CHAT_LOG_LIMIT)
+        ).append(message)
+
+
+def _check_engine_table(table_id: int) -> None:
+    """Hydrate (or verify) the engine table, owning the session lifecycle."""
+
+    db = SessionLocal()
+    try:
+        _get_engine_table(table_id, db)
+    finally:
+        db.close()
 
 
 async def _broadcast_chat(table_id: int, payload: dict) -> None:
+    """Fan a chat payload out to a table's sockets.
+
+    Single publish seam for chat, mirroring publish_table_update for state:
+    a multi-worker deployment would swap this body for a message-bus publish
+    (e.g. Redis pub/sub, with the backlog in a Redis list) while each worker
+    keeps fanning out to its own sockets.
+    """
+
     connections = TABLE_CONNECTIONS.get(table_id, {})
-    for ws in list(connections.keys()):
-        try:
-            await ws.send_json(payload)
-        except Exception:
-            connections.pop(ws, None)
+    targets = list(connections.items())
+    if not targets:
+        return
+
+    # Serialize once for the whole table — chat payloads are identical for
+    # every viewer — then send concurrently so one slow client delays the
+    # message for nobody else; state broadcasts get the same properties from
+    # their per-socket writer tasks.
+    text = orjson.dumps(payload).decode()
+    results = await asyncio.gather(
+        *(ws.send_text(text) for ws, _ in targets), return_exceptions=True
+    )
+    for (ws, viewer_user_id), result in zip(targets, results):
+        if isinstance(result, Exception):
+            # Full unregistration (not a bare pop) so the socket's queue and
+            # writer task are torn down under the registry lock too.
+            unregister_ws(table_id, ws, viewer_user_id)
 
 
 @ws_router.websocket("/ws/tables/{table_id}")
@@ -66,31 +180,31 @@ async def table_ws(websocket: WebSocket, table_id: int):
     # Accept the connection
     await websocket.accept()
 
-    # Ensure engine table exists
-    db = SessionLocal()
-    try:
-        _get_engine_table(table_id, db)
-    except Exception:
-        await websocket.close()
-        db.close()
-        return
-    finally:
-        db.close()
+    # Ensure engine table exists. The common case — a table already live in
+    # this process — needs no DB at all; only cold hydration (first connect
+    # after a restart) opens a session, kept off the event loop.
+    if table_id not in TABLES:
+        try:
+            await run_in_threadpool(_check_engine_table, table_id)
+        except Exception:
+            await websocket.close()
+            return
 
     # Get token from query string: ws://.../ws/tables/1?token=...
     token = websocket.query_params.get("token")
     viewer_user_id = _get_user_id_from_token(token)
 
-    if table_id not in TABLE_CONNECTIONS:
-        TABLE_CONNECTIONS[table_id] = {}
-    TABLE_CONNECTIONS[table_id][websocket] = viewer_user_id
-
-    if viewer_user_id is not None:
-        USER_CONNECTIONS.setdefault(viewer_user_id, set()).add(websocket)
+    register_ws(table_id, websocket, viewer_user_id)
 
     # Send initial state + chat backlog
-    await websocket.send_json({"type": "chat_history", "messages": TABLE_CHAT_LOGS.get(table_id, [])})
-    await broadcast_table_state(table_id)
+    with _CHAT_LOG_LOCK:
+        chat_backlog = list(TABLE_CHAT_LOGS.get(table_id, ()))
+    await websocket.send_text(
+        orjson.dumps({"type": "chat_history", "messages": chat_backlog}).decode()
+    )
+    # A fresh viewer may arrive after timeouts lapsed with nobody polling, so
+    # bring the table current before the first frame goes out.
+    await refresh_and_broadcast(table_id)
 
     try:
         while True:
@@ -105,31 +219,34 @@ async def table_ws(websocket: WebSocket, table_id: int):
                 message_text = str(payload.get("message") or "").strip()
                 if not message_text:
                     continue
-                username = _resolve_username(
-                    viewer_user_id, str(payload.get("username") or "").strip()
+                # Threadpool: a username-cache miss opens a session and
+                # queries, which must not block the loop driving the sends.
+                username = await run_in_threadpool(
+                    _resolve_username,
+                    viewer_user_id,
+                    str(payload.get("username") or "").strip(),
                 )
+                # One clock read covers both the id and the timestamp; the
+                # old code called datetime.utcnow() twice per message.
+                now_ms = time.time_ns() // 1_000_000
                 entry = {
-                    "id": f"{table_id}-{int(datetime.utcnow().timestamp() * 1000)}",
+                    "id": f"{table_id}-{now_ms}",
                     "user_id": viewer_user_id,
                     "username": username,
                     "message": message_text,
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": datetime.utcfromtimestamp(now_ms / 1000).isoformat(),
                 }
                 _append_chat_message(table_id, entry)
                 await _broadcast_chat(table_id, {"type": "chat_message", "message": entry})
                 continue
 
-            await broadcast_table_state(table_id)
+            # Non-chat messages are keepalives or explicit refresh requests.
+            # Broadcasting unchanged state would just re-serialize it for the
+            # dedupe layer to drop, so only fan out when the engine version
+            # moved since the last broadcast.
+            if table_state_stale(table_id):
+                await broadcast_table_state(table_id)
     except WebSocketDisconnect:
         pass
     finally:
-        TABLE_CONNECTIONS.get(table_id, {}).pop(websocket, None)
-        if table_id in TABLE_CONNECTIONS and not TABLE_CONNECTIONS[table_id]:
-            del TABLE_CONNECTIONS[table_id]
-
-        if viewer_user_id is not None:
-            sockets = USER_CONNECTIONS.get(viewer_user_id)
-            if sockets is not None:
-                sockets.discard(websocket)
-                if not sockets:
-                    del USER_CONNECTIONS[viewer_user_id]
+        unregister_ws(table_id, websocket, viewer_user_id)
@@ -0,0 +1,78 @@
+import json
+
+from app.poker.table import Table
+from app.tables_api import TABLES, _STATE_CACHE, _auto_progress_hand, _serialized_state
+
+TABLE_ID = 901
+
+
+def _make_table():
+    table = Table()
+    table.add_player("Alice", user_id=1)
+    table.add_player("Bob", user_id=2)
+    table.start_new_hand()
+    TABLES[TABLE_ID] = table
+    return table
+
+
+def _cleanup():
+    TABLES.pop(TABLE_ID, None)
+    _STATE_CACHE.pop(TABLE_ID, None)
+
+
+def _players_by_user(serialized):
+    return {p.get("user_id"): p for p in json.loads(serialized)["players"]}
+
+
+def test_hole_cards_only_visible_to_their_owner():
+    table = _make_table()
+    try:
+        masked = ["XX", "XX"]
+        # Second pass serves every payload from the per-version cache; the
+        # masking guarantees must hold there too.
+        for _ in range(2):
+            alice_view = _players_by_user(_serialized_state(TABLE_ID, table, 1))
+            bob_view = _players_by_user(_serialized_state(TABLE_ID, table, 2))
+
+            assert alice_view[1]["hole_cards"] == table.player_for_user(1).hole_strs
+            assert alice_view[2]["hole_cards"] == masked
+            assert bob_view[2]["hole_cards"] == table.player_for_user(2).hole_strs
+            assert bob_view[1]["hole_cards"] == masked
+
+            # Spectators and unseated users see nothing, from the same cache
+            # entry as each other.
+            for viewer in (None, 999):
+                view = _players_by_user(_serialized_state(TABLE_ID, table, viewer))
+                assert view[1]["hole_cards"] == masked
+                assert view[2]["hole_cards"] == masked
+    finally:
+        _cleanup()
+
+
+def test_mutation_invalidates_cached_state():
+    table = _make_table()
+    try:
+        before = json.loads(_serialized_state(TABLE_ID, table, None))
+        actor = next(p for p in table.players if p.seat == table.next_to_act_seat)
+        table.player_action(actor.id, "raise_to", 10)
+        after = json.loads(_serialized_state(TABLE_ID, table, None))
+
+        assert after["pot"] > before["pot"]
+        assert after["current_bet"] == 10
+    finally:
+        _cleanup()
+
+
+def test_win_by_fold_payout_reaches_cached_state():
+    table = _make_table()
+    try:
+        actor = next(p for p in table.players if p.seat == table.next_to_act_seat)
+        table.player_action(actor.id, "fold")
+        assert _auto_progress_hand(table) is True
+
+        state = json.loads(_serialized_state(TABLE_ID, table, None))
+        assert state["street"] == "showdown"
+        assert state["pot"] == 0
+        assert state["next_to_act_seat"] is None
+    finally:
+        _cleanup()
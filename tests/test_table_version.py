@@ -0,0 +1,58 @@
+from app.poker.table import Table
+
+
+def test_version_strictly_increases_across_mutations():
+    table = Table()
+    last_seen = table.version
+
+    def assert_bumped():
+        nonlocal last_seen
+        assert table.version > last_seen
+        last_seen = table.version
+
+    alice = table.add_player("Alice", user_id=1)  # seat 0, small blind
+    assert_bumped()
+    bob = table.add_player("Bob", user_id=2)      # seat 1, big blind
+    charlie = table.add_player("Charlie", user_id=3)  # seat 2, acts first
+    last_seen = table.version
+
+    table.start_new_hand()
+    assert_bumped()
+
+    table.player_action(charlie.id, "call")
+    assert_bumped()
+    table.player_action(alice.id, "call")
+    table.player_action(bob.id, "check")
+    last_seen = table.version
+
+    table.deal_flop()
+    assert_bumped()
+    table.deal_turn()
+    assert_bumped()
+    table.deal_river()
+    assert_bumped()
+    table.showdown()
+    assert_bumped()
+
+    table.sit_out_player(table.player_for_user(1))
+    assert_bumped()
+    table.return_player_to_game(table.player_for_user(1))
+    assert_bumped()
+    table.move_player_to_seat(1, 5)
+    assert_bumped()
+    table.remove_player_by_user(1)
+    assert_bumped()
+
+
+def test_failed_action_does_not_bump_version():
+    table = Table()
+    table.add_player("Alice")
+    bob = table.add_player("Bob")
+    table.start_new_hand()
+
+    before = table.version
+    try:
+        table.player_action(bob.id, "call")  # not Bob's turn
+    except ValueError:
+        pass
+    assert table.version == before